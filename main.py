@@ -20,6 +20,6 @@ title = config["animation"]["title"]
 
 simulator = PathSimulator(speed_of_light, material_velocity_1, material_velocity_2, point_a, point_b, interface_y,
                           plane_size)
-animator = Animator(simulator.calculate_path(), (material_velocity_1, material_velocity_2), plane_size, frames,
+animator = Animator(simulator.path, (material_velocity_1, material_velocity_2), plane_size, frames,
                     title, image, image_zoom)
 animator.run()
@@ -1,7 +1,22 @@
 import math
 from typing import Tuple
 import numpy as np
-from scipy.optimize import minimize
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional, without it the kernels below simply run as plain Python functions
+    def njit(*_args, **_kwargs):
+        return lambda function: function
+
+
+@njit(cache=True, fastmath=True)
+def _travel_time(x, ax, ay, bx, by, iy, inv_v1, inv_v2):
+    """
+    Total travel time from A = (ax, ay) to B = (bx, by) through the point (x, iy) on the interface, where inv_v1 and
+    inv_v2 are the inverse velocities in the two media (i.e. the refractive indices divided by the speed of light).
+    """
+    return math.hypot(x - ax, iy - ay) * inv_v1 + math.hypot(bx - x, by - iy) * inv_v2
 
 
 class PathSimulator:
@@ -25,6 +40,8 @@ class PathSimulator:
         The y-coordinate of the horizontal boundary between the two media.
     plane_size : tuple
         Size (width, height) of the entire simulation plane.
+    path : ndarray
+        The path of the light ray as returned by `calculate_path`, calculated on first access and cached.
     speed_of_light : float
         Specifies the speed of light in vacuum.
 
@@ -34,20 +51,24 @@ class PathSimulator:
     Initializes the simulator with given refractive indices, points A and B, and interface coordinate.
 
     calculate_distance_and_incidence_angle(self, x): For a given x-coordinate on the interface, calculates the
-    distance and incidence angle for the light ray traveling from point A, reflecting off the interface at this
-    x-coordinate, and then reaching point B.
+    distance and the cosine and sine of the incidence angle for the light ray traveling from point A, reflecting off
+    the interface at this x-coordinate, and then reaching point B.
 
     time_to_travel(self, x): For a given x-coordinate on the interface, calculates the time for a light ray to travel
     from point A, reflect off the interface at this x-coordinate, and then reach point B.
 
     calculate_optimal_path(self): Calculates and returns the x-coordinate on the interface that minimizes the travel
-    time for the light ray.
+    time for the light ray, by solving Snell's Law for it in closed form.
 
     calculate_path(self, x): Given the x-coordinate on the interface where the light ray reflects, this method
     calculates the entire path of the light ray from point A, via the reflection point, to point B. Returns the path
-    as a list of points (x, y).
+    as an array of the three points (x, y).
     """
 
+    # Fixed attribute layout, which also makes attribute access in the per-call methods cheaper.
+    __slots__ = ('speed_of_light', 'refractive_index_1', 'refractive_index_2', 'point_a', 'point_b', 'interface_y',
+                 'plane_size', '_inv_v1', '_inv_v2', '_n1_over_n2', '_path')
+
     # Constructor to initialize the simulation parameters.
     def __init__(self, speed_of_light: float, material_velocity_1: float, material_velocity_2: float,
                  point_a: Tuple[float, float], point_b: Tuple[float, float],
@@ -57,6 +78,10 @@ class PathSimulator:
         # Calculate refractive indices for the two materials
         self.refractive_index_1 = self.speed_of_light / material_velocity_1
         self.refractive_index_2 = self.speed_of_light / material_velocity_2
+        # Precompute the inverse velocities (n / c) for the travel time and the index ratio for Snell's Law
+        self._inv_v1 = 1.0 / material_velocity_1
+        self._inv_v2 = 1.0 / material_velocity_2
+        self._n1_over_n2 = material_velocity_2 / material_velocity_1
         # Start and end points of the light path as tuples
         self.point_a = point_a
         self.point_b = point_b
@@ -64,22 +89,38 @@ class PathSimulator:
         self.interface_y = interface_y
         # Dimensions of the 2D simulation plane as a tuple
         self.plane_size = plane_size
+        # Light path, calculated on first access of `path`
+        self._path = None
+
+    # The light path for the simulation parameters, calculated once and cached.
+    @property
+    def path(self):
+        """
+        The path of the light ray from point A, via the interface, to point B as returned by `calculate_path`. Since
+        the path is fully determined by the constructor arguments it is only calculated on first access.
+        """
+        if self._path is None:
+            self._path = self.calculate_path()
+        return self._path
 
     # Calculate the Euclidean distance from point A to the interface and the incidence angle.
     def calculate_distance_and_incidence_angle(self, x_interface):
         """
-        Given an x_coordinate on the interface, this method computes the distance and incidence angle from point A to
-        the interface. Physics Concept: The incidence angle is the angle that the incoming ray makes with the surface
-        normal (the line perpendicular to the surface at the point of incidence).
+        Given an x_coordinate on the interface, this method computes the distance from point A to the interface
+        together with the cosine and sine of the incidence angle, taken directly from the sides of the right triangle
+        rather than through trigonometric functions. Physics Concept: The incidence angle is the angle that the
+        incoming ray makes with the surface normal (the line perpendicular to the surface at the point of incidence).
         """
         # Calculate horizontal and vertical differences
         dx = x_interface - self.point_a[0]
         dy = self.interface_y - self.point_a[1]
         # Calculate distance using Pythagorean theorem
-        distance_1 = np.sqrt(dx ** 2 + dy ** 2)
-        # Incidence angle based on the arctangent of opposite over adjacent side
-        incidence_angle = math.atan2(dy, dx)  # Right-triangle opposite/adjacent
-        return distance_1, incidence_angle
+        distance_1 = math.hypot(dx, dy)
+        # Handle point A lying on the interface, where the direction is undefined
+        if not distance_1:
+            return distance_1, 0.0, 0.0
+        # Cosine and sine as adjacent and opposite side over hypotenuse
+        return distance_1, dx / distance_1, dy / distance_1
 
     # Compute the total time taken for light to travel through both mediums.
     def time_to_travel(self, x_interface):
@@ -88,82 +129,63 @@ class PathSimulator:
         The total travel time is the sum of the time spent in each medium, calculated as distance divided by speed (
         speed here is the speed of light adjusted by the refractive index)
         """
-        distance_1, incidence_angle = self.calculate_distance_and_incidence_angle(x_interface)
-
-        # Calculate distances in each medium
-        segment_1 = distance_1  # Total distance from A to interface
-        segment_2 = np.sqrt((self.point_b[0] - x_interface) ** 2 + (self.point_b[1] - self.interface_y) ** 2)
+        return _travel_time(x_interface, *self._kernel_args())
 
-        # Compute time spent in each medium, considering the respective speeds
-        time_material_1 = segment_1 / self.speed_of_light * self.refractive_index_1
-        time_material_2 = segment_2 / self.speed_of_light * self.refractive_index_2
-
-        return time_material_1 + time_material_2
+    # Bundle the scalar parameters expected by the module level kernels.
+    def _kernel_args(self):
+        return (self.point_a[0], self.point_a[1], self.point_b[0], self.point_b[1], self.interface_y,
+                self._inv_v1, self._inv_v2)
 
     # Determine the x-coordinate at the interface that minimizes the travel time.
     def calculate_optimal_path(self):
         """
-        This function uses an optimization algorithm to find the x-coordinate on the interface that results in the
-        least time of travel. Physics Concept: Fermat's Principle aka the principle of least time states that the
-        path taken by a ray between two given points is the path that requires the least time.
+        This function finds the x-coordinate on the interface that results in the least time of travel. Physics
+        Concept: Fermat's Principle aka the principle of least time states that the path taken by a ray between two
+        given points is the path that requires the least time. Setting the derivative of the travel time to zero
+        gives Snell's Law, which after squaring becomes a quartic in the position of the interface point, so the
+        optimum is obtained in closed form from the roots of that quartic rather than by iterating.
         """
-        # Calculate the minimum and maximum x values from point A and point B and define the bounds for the optimizer
-        # based on the coordinates of points A and B
-        min_x = min(self.point_a[0], self.point_b[0])
-        max_x = max(self.point_a[0], self.point_b[0])
-
-        # Define the bounds for the optimizer to use
-        bounds_x = [(min_x, max_x)]
-
-        # Set the initial guess for the optimizer as the x-coordinate of point A
-        x0 = self.point_a[0]
-
-        # Use a minimization technique from SciPy to find the optimal path that minimizes the time of travel
-        res = minimize(self.time_to_travel, x0, method='L-BFGS-B', bounds=bounds_x,
-                       options={'xatol': 1e-10, 'disp': True})
-
-        return res.x[0]
+        # Horizontal distance from point A to point B, the optimal interface point always lies between them
+        width = self.point_b[0] - self.point_a[0]
+
+        # Handle the vertical case, where the straight line from A to B is already the optimal path
+        if width == 0:
+            return self.point_a[0]
+
+        # Write the interface point as x = A_x + t * width with t in [0, 1] and scale the heights of A and B above
+        # the interface accordingly. Squaring Snell's Law, (n1 / n2)^2 * t^2 * ((1 - t)^2 + b^2) = (1 - t)^2 *
+        # (t^2 + a^2), then gives a quartic in t.
+        a = (self.interface_y - self.point_a[1]) / width
+        b = (self.point_b[1] - self.interface_y) / width
+        k = self._n1_over_n2 ** 2
+        roots = np.roots([k - 1, -2 * (k - 1), k * (1 + b ** 2) - 1 - a ** 2, 2 * a ** 2, -a ** 2])
+
+        # Squaring introduces spurious roots, so keep the candidate in [0, 1] (endpoints included for the case of a
+        # point lying on the interface) with the least travel time
+        candidates = [self.point_a[0] + t * width for t in np.clip(roots.real, 0.0, 1.0).tolist() + [0.0, 1.0]]
+        return min(candidates, key=self.time_to_travel)
 
     # Calculate the full path of light from point A to B through the interface.
     def calculate_path(self):
         """
         With the optimal reflection x_coordinate determined, the complete path of the ray can be computed. Physics
         Concept: Snell's Law is the foundation for this method. Snell's Law relates the incidence angle,
-        the refraction angle, and the refractive indices of the two media.
+        the refraction angle, and the refractive indices of the two media. Since the interface point already satisfies
+        it, the path is the straight segment from point A to that point followed by the straight segment to point B.
         """
         # Find the optimal interface x-coordinate
         x_interface_optimal = self.calculate_optimal_path()
 
         # Compute distance and incidence angle at this interface point
-        distance_1, incidence_angle = self.calculate_distance_and_incidence_angle(x_interface_optimal)
-
-        # Calculate refraction angle
-        sine_incidence = math.sin(incidence_angle)
-        sine_refraction = (self.refractive_index_1 / self.refractive_index_2) * sine_incidence
-        sine_refraction = np.clip(sine_refraction, -1, 1)
-        refraction_angle = math.asin(sine_refraction)
-
-        # Calculate the x,y coordinates for the incidence point
-        x_incidence = self.point_a[0] + distance_1 * math.cos(incidence_angle)
-        y_incidence = self.point_a[1] + distance_1 * math.sin(incidence_angle)
-
-        # Calculate the second segment distance in the second material
-        segment_2 = np.sqrt((self.point_b[0] - x_interface_optimal) ** 2 + (self.point_b[1] - self.interface_y) ** 2)
-
-        # Determine the direction of the refracted path
-        if self.point_b[0] != x_interface_optimal:
-            slope = (self.point_b[1] - self.interface_y) / (self.point_b[0] - x_interface_optimal)
-            angle_to_horizontal = math.atan(slope)
-        else:
-            # Handle the vertical case
-            angle_to_horizontal = math.pi / 2 * np.sign(self.point_b[1] - self.interface_y)
-
-        # Calculate the x,y coordinates for the refraction point based on the direction after refraction
-        x_refraction = x_interface_optimal + segment_2 * math.cos(angle_to_horizontal)
-        y_refraction = self.interface_y + segment_2 * math.sin(angle_to_horizontal)
-
-        # Define the path segments for visual representation or further analysis
-        path_segment_1 = np.array([self.point_a, [x_incidence, self.interface_y]])
-        path_segment_2 = np.array([[x_refraction, y_refraction], self.point_b])
-
-        return np.concatenate((path_segment_1, path_segment_2), axis=0)
+        distance_1, cosine_incidence, sine_incidence = self.calculate_distance_and_incidence_angle(x_interface_optimal)
+
+        # Calculate the x coordinate for the incidence point
+        x_incidence = self.point_a[0] + distance_1 * cosine_incidence
+
+        # Define the path from point A, via the incidence point on the interface, to point B, filled in place
+        path = np.empty((3, 2))
+        path[0] = self.point_a
+        path[1, 0] = x_incidence
+        path[1, 1] = self.interface_y
+        path[2] = self.point_b
+        return path
@@ -1,6 +1,12 @@
 import yaml
 
+try:
+    # Use the libyaml based parser when PyYAML was built with it
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 def load_config(config_file):
     with open(config_file, 'r') as file:
-        return yaml.safe_load(file)
+        return yaml.load(file, Loader=SafeLoader)
@@ -1,9 +1,8 @@
 from typing import Tuple
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
-import matplotlib.image as mpimg
-from matplotlib.offsetbox import OffsetImage, AnnotationBbox
+
+# matplotlib and Pillow are imported where they are first needed, so importing this module (e.g. alongside
+# `PathSimulator` for headless use) does not pay for loading the plotting stack.
 
 
 class Animator:
@@ -37,15 +36,19 @@ class Animator:
     init() -> Tuple:
         Initializes the markers and paths for the animation.
     animate(i: int) -> Tuple:
-        Updates the markers and paths for the `i`th frame of the animation.
-    generate_frames() -> List:
-        Generates all frames for the animation, marking the position of light in each frame.
+        Updates the marker for the `i`th frame of the animation.
+    generate_frames() -> ndarray:
+        Generates all frames for the animation as an (N, 2) array, marking the position of light in each frame.
     run() -> None:
         Creates and runs the animation.
     """
     def __init__(self, path: np.ndarray, velocities: Tuple[float, float], plane_size: Tuple[float, float],
                  total_frames: int = 200, title: str = "Animation of Light Path", image_filename: str = None,
                  image_zoom: float = 0.5):
+        import matplotlib.pyplot as plt
+        from matplotlib.offsetbox import OffsetImage, AnnotationBbox
+        from PIL import Image
+
         self.path = path
         self.velocities = velocities
         self.plane_size = plane_size
@@ -57,8 +60,11 @@ class Animator:
         self.scat = None
         if image_filename:
             try:
-                self.marker_image = mpimg.imread(image_filename)
-                self.imagebox = AnnotationBbox(OffsetImage(self.marker_image, zoom=image_zoom), (0, 0), frameon=False)
+                # Decode the image once into an RGBA uint8 array, which matplotlib can blit without converting floats
+                with Image.open(image_filename) as image:
+                    self.marker_image = np.asarray(image.convert('RGBA'))
+                self.imagebox = AnnotationBbox(OffsetImage(self.marker_image, zoom=image_zoom, interpolation='nearest'),
+                                               (0, 0), frameon=False)
                 self.ax.add_artist(self.imagebox)
                 self.imagebox.set_visible(False)
                 self.use_image = True
@@ -69,48 +75,53 @@ class Animator:
 
         if not self.use_image:
             self.scat = self.ax.scatter([], [], s=50, color='black')  # Default to black dot if no image
+            # Reusable (1, 2) buffer holding the marker position, filled in place on every frame
+            self._offset_buf = np.empty((1, 2))
 
+        # Artists redrawn on every frame, kept as one tuple so blitting always sees the same set
+        self.artists = (self.line, self.scat if self.scat else self.imagebox)
         self.frames = self.generate_frames()
 
     def init(self):
-        self.line.set_data([], [])
+        # The path never changes, so its line data is set once here instead of on every frame
+        self.line.set_data(self.path[:, 0], self.path[:, 1])
         if not self.use_image:
             self.scat.set_offsets(np.empty((0, 2)))
-        return self.line, self.scat if self.scat else self.imagebox
+        return self.artists
 
     def animate(self, i):
         """
-        This function updates the marker and path of light for each frame 'i' of the animation.
-        If a marker image is being used, it sets the image's location to the current frame's position.
+        This function updates the marker of light for each frame 'i' of the animation, the path itself is drawn once
+        by `init`. If a marker image is being used, it sets the image's location to the current frame's position.
         Otherwise, it updates the scatter plot (which is acting as the marker in this case).
         """
-        frame = self.frames[i]
-        x, y = frame
-        self.line.set_data(self.path[:, 0], self.path[:, 1])
+        x, y = self.frames[i]
         if self.use_image:
             self.imagebox.xybox = (x, y)
             self.imagebox.set_visible(True)
         else:
-            self.scat.set_offsets(np.c_[x, y])
-        return self.line, self.scat if self.scat else self.imagebox
+            self._offset_buf[0, 0] = x
+            self._offset_buf[0, 1] = y
+            self.scat.set_offsets(self._offset_buf)
+        return self.artists
 
     def generate_frames(self):
         """
-        This function generates all the frames for the animation. It does this by computing the distance of each
-        segment of the path (from refraction interface) and determining how many frames should be spent on each
-        segment proportional to its length. Then it computes the exact position of the marker (the light's position)
-        on each of those frames.
+        This function generates all the frames for the animation. The path from the simulator always consists of the
+        start point, the point on the refraction interface and the end point, so the frames are split between its
+        two segments in proportion to their lengths. The exact position of the marker (the light's position) on each
+        of those frames is then filled in one segment at a time, straight into a preallocated array.
         """
-        frames = []
-        path_lengths = np.sqrt(np.diff(self.path[:, 0]) ** 2 + np.diff(self.path[:, 1]) ** 2)
-        total_length = np.sum(path_lengths)
-        segment_frames = [int(self.total_frames * length / total_length) for length in path_lengths]
-        for segment_index, num_frames in enumerate(segment_frames):
-            for i in range(num_frames):
-                t = i / num_frames
-                x = np.interp(t, [0, 1], self.path[segment_index:segment_index + 2, 0])
-                y = np.interp(t, [0, 1], self.path[segment_index:segment_index + 2, 1])
-                frames.append((x, y))
+        if len(self.path) != 3:
+            raise ValueError(f"Expected a path of 3 points (start, interface, end), got {len(self.path)}.")
+        start, interface, end = self.path
+        length_1 = np.hypot(*(interface - start))
+        length_2 = np.hypot(*(end - interface))
+        frames_1 = round(self.total_frames * length_1 / (length_1 + length_2))
+        frames = np.empty((self.total_frames, 2))
+        # The first segment stops just short of the interface point, the second runs from it up to the end point
+        frames[:frames_1] = start + np.linspace(0, 1, frames_1, endpoint=False)[:, None] * (interface - start)
+        frames[frames_1:] = interface + np.linspace(0, 1, self.total_frames - frames_1)[:, None] * (end - interface)
         return frames
 
     def run(self):
@@ -119,6 +130,10 @@ class Animator:
         and title, then creates the animation object using matplotlib's FuncAnimation. Finally, it shows the
         animation after setting up the legend.
         """
+        import matplotlib.pyplot as plt
+        import matplotlib.animation as animation
+        from visualization.writers import RawFrameFFMpegWriter
+
         self.ax.set_xlim(0, self.plane_size[0])
         self.ax.set_ylim(0, self.plane_size[1])
         self.ax.set_xlabel('X position')
@@ -130,5 +145,8 @@ class Animator:
         anim = animation.FuncAnimation(self.fig, self.animate, init_func=self.init,
                                        frames=len(self.frames), interval=1000 / 30, blit=True)
         self.ax.legend()
-        anim.save('animation.mp4', writer='ffmpeg', fps=30)
+        # Encode with the fastest x264 preset at a modest resolution, the raw canvas buffers are streamed to ffmpeg
+        writer = RawFrameFFMpegWriter(fps=30, codec='libx264',
+                                      extra_args=['-preset', 'ultrafast', '-tune', 'animation', '-pix_fmt', 'yuv420p'])
+        anim.save('animation.mp4', writer=writer, dpi=80)
         plt.show()
@@ -0,0 +1,46 @@
+import matplotlib.animation as animation
+
+
+class RawFrameFFMpegWriter(animation.FFMpegWriter):
+    """
+    The `RawFrameFFMpegWriter` class is an `FFMpegWriter` that hands the rendered canvas buffer straight to ffmpeg.
+
+    The stock writer produces every frame through `Figure.savefig`, which re-applies the save dpi, face colour and
+    layout settings each time before rasterizing. This writer instead switches the figure to the movie dpi once for
+    the whole recording, draws the Agg canvas and writes its RGBA buffer to the ffmpeg pipe as raw video, so each
+    frame costs a single rasterization and memory copy. Frames fall back to the stock `savefig` path whenever the
+    canvas is not Agg based or savefig options other than an opaque face colour are requested.
+
+    Methods:
+    --------
+    setup(fig, outfile, dpi=None) -> None:
+        Starts ffmpeg and switches the figure to the movie dpi until `finish` is called.
+    grab_frame(**savefig_kwargs) -> None:
+        Draws the figure and writes the raw RGBA frame to ffmpeg.
+    finish() -> None:
+        Finishes the movie and restores the figure's dpi and face colour.
+    """
+    def setup(self, fig, outfile, dpi=None):
+        super().setup(fig, outfile, dpi=dpi)
+        # Remember the figure settings changed for the recording so finish() can restore them
+        self._original_dpi = fig.dpi
+        self._original_facecolor = fig.get_facecolor()
+        fig.set_dpi(self.dpi)
+
+    def grab_frame(self, **savefig_kwargs):
+        if (set(savefig_kwargs) - {'facecolor', 'transparent'} or savefig_kwargs.get('transparent')
+                or not hasattr(self.fig.canvas, 'buffer_rgba')):
+            return super().grab_frame(**savefig_kwargs)
+        # All frames must have the same size, so undo any resizing exactly like the stock writer does
+        self.fig.set_size_inches(self._w, self._h)
+        if 'facecolor' in savefig_kwargs:
+            self.fig.set_facecolor(savefig_kwargs['facecolor'])
+        self.fig.canvas.draw()
+        self._proc.stdin.write(self.fig.canvas.buffer_rgba())
+
+    def finish(self):
+        try:
+            super().finish()
+        finally:
+            self.fig.set_dpi(self._original_dpi)
+            self.fig.set_facecolor(self._original_facecolor)